@@ -66,6 +66,7 @@ if TYPE_CHECKING:
 
 # TODO: CASCADE in DROPs, keep track of what will be deleted
 class Action:
+    __slots__ = ("rng", "composition")
     rng: random.Random
     composition: Composition | None
 
@@ -125,6 +126,8 @@ class Action:
 
 
 class FetchAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.complexity == Complexity.DDL:
@@ -155,6 +158,8 @@ class FetchAction(Action):
 
 
 class SelectOneAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         exe.execute("SELECT 1", explainable=True)
         exe.cur.fetchall()
@@ -162,6 +167,8 @@ class SelectOneAction(Action):
 
 
 class SelectAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         result.extend(
@@ -230,6 +237,7 @@ class SelectAction(Action):
 
 
 class SQLsmithAction(Action):
+    __slots__ = ("queries",)
     composition: Composition
     queries: list[str]
 
@@ -309,6 +317,8 @@ class SQLsmithAction(Action):
 
 
 class InsertAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "cannot be run inside a transaction block",
@@ -360,6 +370,8 @@ class InsertAction(Action):
 
 
 class SourceInsertAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             sources = [
@@ -386,6 +398,8 @@ class SourceInsertAction(Action):
 
 
 class UpdateAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "canceling statement due to statement timeout",
@@ -414,6 +428,8 @@ class UpdateAction(Action):
 
 
 class DeleteAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "canceling statement due to statement timeout",
@@ -440,6 +456,8 @@ class DeleteAction(Action):
 
 
 class CommentAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         table = self.rng.choice(exe.db.tables)
 
@@ -454,6 +472,8 @@ class CommentAction(Action):
 
 
 class CreateIndexAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "already exists",  # TODO: Investigate
@@ -481,6 +501,8 @@ class CreateIndexAction(Action):
 
 
 class DropIndexAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if not exe.db.indexes:
@@ -497,6 +519,8 @@ class DropIndexAction(Action):
 
 
 class CreateTableAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         if len(exe.db.tables) >= MAX_TABLES:
             return False
@@ -513,6 +537,8 @@ class CreateTableAction(Action):
 
 
 class DropTableAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -535,6 +561,8 @@ class DropTableAction(Action):
 
 
 class RenameTableAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         if exe.db.scenario != Scenario.Rename:
             return False
@@ -556,6 +584,8 @@ class RenameTableAction(Action):
 
 
 class RenameViewAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         if exe.db.scenario != Scenario.Rename:
             return False
@@ -580,6 +610,8 @@ class RenameViewAction(Action):
 
 
 class RenameSinkAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         if exe.db.scenario != Scenario.Rename:
             return False
@@ -604,6 +636,8 @@ class RenameSinkAction(Action):
 
 
 class CreateDatabaseAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if len(exe.db.dbs) >= MAX_DBS:
@@ -617,6 +651,8 @@ class CreateDatabaseAction(Action):
 
 
 class DropDatabaseAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "cannot be dropped with RESTRICT while it contains schemas",
@@ -639,6 +675,8 @@ class DropDatabaseAction(Action):
 
 
 class CreateSchemaAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if len(exe.db.schemas) >= MAX_SCHEMAS:
@@ -652,6 +690,8 @@ class CreateSchemaAction(Action):
 
 
 class DropSchemaAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "cannot be dropped without CASCADE while it contains objects",
@@ -674,6 +714,8 @@ class DropSchemaAction(Action):
 
 
 class RenameSchemaAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "ambiguous reference to schema named"  # see https://github.com/MaterializeInc/materialize/pull/22551#pullrequestreview-1691876923
@@ -700,6 +742,8 @@ class RenameSchemaAction(Action):
 
 
 class SwapSchemaAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "object state changed while transaction was in progress",
@@ -744,6 +788,8 @@ class SwapSchemaAction(Action):
 
 
 class TransactionIsolationAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         level = self.rng.choice(["SERIALIZABLE", "STRICT SERIALIZABLE"])
         exe.set_isolation(level)
@@ -751,6 +797,8 @@ class TransactionIsolationAction(Action):
 
 
 class CommitRollbackAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         if not exe.action_run_since_last_commit_rollback:
             return False
@@ -764,6 +812,8 @@ class CommitRollbackAction(Action):
 
 
 class CreateViewAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if len(exe.db.views) >= MAX_VIEWS:
@@ -795,6 +845,8 @@ class CreateViewAction(Action):
 
 
 class DropViewAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -820,6 +872,8 @@ class DropViewAction(Action):
 
 
 class CreateRoleAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if len(exe.db.roles) >= MAX_ROLES:
@@ -833,6 +887,8 @@ class CreateRoleAction(Action):
 
 
 class DropRoleAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "cannot be dropped because some objects depend on it",
@@ -864,6 +920,8 @@ class DropRoleAction(Action):
 
 
 class CreateClusterAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if len(exe.db.clusters) >= MAX_CLUSTERS:
@@ -883,6 +941,8 @@ class CreateClusterAction(Action):
 
 
 class DropClusterAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             # cannot drop cluster "..." because other objects depend on it
@@ -916,6 +976,8 @@ class DropClusterAction(Action):
 
 
 class SwapClusterAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "object state changed while transaction was in progress",
@@ -960,6 +1022,8 @@ class SwapClusterAction(Action):
 
 
 class SetClusterAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "SET cluster cannot be called in an active transaction",
@@ -976,6 +1040,8 @@ class SetClusterAction(Action):
 
 
 class CreateClusterReplicaAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = [
             "cannot create more than one replica of a cluster containing sources or sinks",
@@ -1008,6 +1074,8 @@ class CreateClusterReplicaAction(Action):
 
 
 class DropClusterReplicaAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             # Keep cluster 0 with 1 replica for sources/sinks
@@ -1045,6 +1113,8 @@ class DropClusterReplicaAction(Action):
 
 
 class GrantPrivilegesAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if not exe.db.roles:
@@ -1065,6 +1135,8 @@ class GrantPrivilegesAction(Action):
 
 
 class RevokePrivilegesAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         with exe.db.lock:
             if not exe.db.roles:
@@ -1086,6 +1158,8 @@ class RevokePrivilegesAction(Action):
 
 # TODO: Should factor this out so can easily use it without action
 class ReconnectAction(Action):
+    __slots__ = ("random_role",)
+
     def __init__(
         self,
         rng: random.Random,
@@ -1144,6 +1218,7 @@ class ReconnectAction(Action):
 
 
 class CancelAction(Action):
+    __slots__ = ("workers",)
     workers: list["Worker"]
 
     def errors_to_ignore(self, exe: Executor) -> list[str]:
@@ -1180,6 +1255,13 @@ class CancelAction(Action):
 
 
 class KillAction(Action):
+    __slots__ = (
+        "system_param_fn",
+        "system_parameters",
+        "catalog_store",
+        "sanity_restart",
+    )
+
     def __init__(
         self,
         rng: random.Random,
@@ -1218,6 +1300,7 @@ class KillAction(Action):
 
 # TODO: Don't restore immediately, keep copy Database objects
 class BackupRestoreAction(Action):
+    __slots__ = ("db", "num")
     composition: Composition
     db: Database
     num: int
@@ -1277,6 +1360,8 @@ class BackupRestoreAction(Action):
 
 
 class CreateWebhookSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.scenario in (Scenario.Kill, Scenario.TogglePersistTxn):
@@ -1307,6 +1392,8 @@ class CreateWebhookSourceAction(Action):
 
 
 class DropWebhookSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -1329,6 +1416,8 @@ class DropWebhookSourceAction(Action):
 
 
 class CreateKafkaSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.scenario in (Scenario.Kill, Scenario.TogglePersistTxn):
@@ -1369,6 +1458,8 @@ class CreateKafkaSourceAction(Action):
 
 
 class DropKafkaSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -1391,6 +1482,8 @@ class DropKafkaSourceAction(Action):
 
 
 class CreateMySqlSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.scenario in (Scenario.Kill, Scenario.TogglePersistTxn):
@@ -1435,6 +1528,8 @@ class CreateMySqlSourceAction(Action):
 
 
 class DropMySqlSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -1457,6 +1552,8 @@ class DropMySqlSourceAction(Action):
 
 
 class CreatePostgresSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.scenario in (Scenario.Kill, Scenario.TogglePersistTxn):
@@ -1501,6 +1598,8 @@ class CreatePostgresSourceAction(Action):
 
 
 class DropPostgresSourceAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -1523,6 +1622,8 @@ class DropPostgresSourceAction(Action):
 
 
 class CreateKafkaSinkAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             # Another replica can be created in parallel
@@ -1557,6 +1658,8 @@ class CreateKafkaSinkAction(Action):
 
 
 class DropKafkaSinkAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         return [
             "still depended upon by",
@@ -1579,6 +1682,8 @@ class DropKafkaSinkAction(Action):
 
 
 class HttpPostAction(Action):
+    __slots__ = ()
+
     def errors_to_ignore(self, exe: Executor) -> list[str]:
         result = super().errors_to_ignore(exe)
         if exe.db.scenario == Scenario.Rename:
@@ -1647,6 +1752,8 @@ class HttpPostAction(Action):
 
 
 class StatisticsAction(Action):
+    __slots__ = ()
+
     def run(self, exe: Executor) -> bool:
         for typ, objs in [
             ("tables", exe.db.tables),
@@ -32,7 +32,7 @@ from materialize.data_ingest.transaction import Transaction
 from materialize.data_ingest.workload import WORKLOADS
 from materialize.mzcompose.composition import Composition
 from materialize.mzcompose.services.mysql import MySql
-from materialize.parallel_workload.executor import Executor
+from materialize.parallel_workload.executor import Executor, ExecutorPool
 from materialize.parallel_workload.settings import Complexity, Scenario
 from materialize.util import naughty_strings
 
@@ -1022,39 +1022,61 @@ class Database:
             self.schemas + self.clusters + self.roles + self.db_objects()
         ).__iter__()
 
-    def create(self, exe: Executor, composition: Composition) -> None:
-        for db in self.dbs:
-            db.drop(exe)
-            db.create(exe)
+    def create(self, pool: ExecutorPool, composition: Composition) -> None:
+        with pool.acquire() as exe:
+            for db in self.dbs:
+                db.drop(exe)
+                db.create(exe)
 
-        exe.execute("SELECT name FROM mz_clusters WHERE name LIKE 'c%'")
-        for row in exe.cur.fetchall():
-            exe.execute(f"DROP CLUSTER {identifier(row[0])} CASCADE")
+            exe.execute("SELECT name FROM mz_clusters WHERE name LIKE 'c%'")
+            for row in exe.cur.fetchall():
+                exe.execute(f"DROP CLUSTER {identifier(row[0])} CASCADE")
 
-        exe.execute("SELECT name FROM mz_roles WHERE name LIKE 'r%'")
-        for row in exe.cur.fetchall():
-            exe.execute(f"DROP ROLE {identifier(row[0])} CASCADE")
+            exe.execute("SELECT name FROM mz_roles WHERE name LIKE 'r%'")
+            for row in exe.cur.fetchall():
+                exe.execute(f"DROP ROLE {identifier(row[0])} CASCADE")
 
-        exe.execute(
-            "CREATE CONNECTION IF NOT EXISTS kafka_conn FOR KAFKA BROKER 'kafka:9092', SECURITY PROTOCOL PLAINTEXT"
-        )
-        exe.execute(
-            "CREATE CONNECTION IF NOT EXISTS csr_conn FOR CONFLUENT SCHEMA REGISTRY URL 'http://schema-registry:8081'"
-        )
-        print("Created connections")
+            exe.execute(
+                "CREATE CONNECTION IF NOT EXISTS kafka_conn FOR KAFKA BROKER 'kafka:9092', SECURITY PROTOCOL PLAINTEXT"
+            )
+            exe.execute(
+                "CREATE CONNECTION IF NOT EXISTS csr_conn FOR CONFLUENT SCHEMA REGISTRY URL 'http://schema-registry:8081'"
+            )
+            print("Created connections")
 
-        exe.execute("CREATE SECRET pgpass AS 'postgres'")
-        exe.execute(
-            "CREATE CONNECTION postgres_conn FOR POSTGRES HOST 'postgres', DATABASE postgres, USER postgres, PASSWORD SECRET pgpass"
-        )
+            exe.execute("CREATE SECRET pgpass AS 'postgres'")
+            exe.execute(
+                "CREATE CONNECTION postgres_conn FOR POSTGRES HOST 'postgres', DATABASE postgres, USER postgres, PASSWORD SECRET pgpass"
+            )
 
-        exe.execute(f"CREATE SECRET mypass AS '{MySql.DEFAULT_ROOT_PASSWORD}'")
-        exe.execute(
-            "CREATE CONNECTION mysql_conn FOR MYSQL HOST 'mysql', USER root, PASSWORD SECRET mypass"
-        )
+            exe.execute(f"CREATE SECRET mypass AS '{MySql.DEFAULT_ROOT_PASSWORD}'")
+            exe.execute(
+                "CREATE CONNECTION mysql_conn FOR MYSQL HOST 'mysql', USER root, PASSWORD SECRET mypass"
+            )
+
+        def create_postgres_sources(exe: Executor) -> None:
+            # All of them drop and recreate the same publication
+            for source in self.postgres_sources:
+                source.create(exe)
 
-        for relation in self:
-            relation.create(exe)
+        # Relations only depend on relations of earlier steps, so each step
+        # can be created in parallel
+        pool.run(
+            [
+                relation.create
+                for relation in [*self.schemas, *self.clusters, *self.roles]
+            ]
+        )
+        pool.run(
+            [
+                *(table.create for table in self.tables),
+                *(source.create for source in self.webhook_sources),
+                *(source.create for source in self.kafka_sources),
+                *(source.create for source in self.mysql_sources),
+                create_postgres_sources,
+            ]
+        )
+        pool.run([view.create for view in self.views])
 
         if not self.fast_startup:
             result = composition.run(
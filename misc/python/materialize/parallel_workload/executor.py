@@ -7,8 +7,12 @@
 # the Business Source License, use of this software will be governed
 # by the Apache License, Version 2.0.
 
+import queue
 import random
 import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, TextIO
 
 import pg8000
@@ -76,7 +80,7 @@ class Executor:
         if not logging:
             return
 
-        thread_name = threading.current_thread().getName()
+        thread_name = threading.current_thread().name
         self.last_log = msg
 
         with lock:
@@ -92,7 +96,63 @@ class Executor:
         extra_info_str = f" ({extra_info})" if extra_info else ""
         self.log(f"{query}{extra_info_str}")
         try:
+            # Without parameters pg8000 already sends this as a single
+            # simple Query message, no Parse/Bind/Describe/Execute
             self.cur.execute(query)
         except Exception as e:
             raise QueryError(str(e), query)
         self.action_run_since_last_commit_rollback = True
+
+
+class ExecutorPool:
+    """A fixed set of autocommit connections, each wrapped in an Executor.
+    Tasks check an Executor out, run on it and hand it back."""
+
+    conns: list[pg8000.Connection]
+    executors: "queue.Queue[Executor]"
+
+    def __init__(
+        self,
+        rng: random.Random,
+        db: "Database",
+        host: str,
+        port: int,
+        user: str,
+        size: int,
+    ):
+        self.conns = []
+        self.executors = queue.Queue()
+        for _ in range(size):
+            conn = pg8000.connect(
+                host=host, port=port, user=user, database="materialize"
+            )
+            conn.autocommit = True
+            self.conns.append(conn)
+            self.executors.put(Executor(rng, conn.cursor(), db))
+
+    @contextmanager
+    def acquire(self) -> Iterator[Executor]:
+        exe = self.executors.get()
+        try:
+            yield exe
+        finally:
+            self.executors.put(exe)
+
+    def run(self, tasks: Sequence[Callable[[Executor], None]]) -> None:
+        """Runs independent tasks in parallel on the pooled connections, so
+        that their round trips overlap instead of adding up."""
+
+        def run_task(task: Callable[[Executor], None]) -> None:
+            with self.acquire() as exe:
+                task(exe)
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.conns), thread_name_prefix="setup"
+        ) as executor:
+            futures = [executor.submit(run_task, task) for task in tasks]
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        for conn in self.conns:
+            conn.close()
@@ -8,13 +8,14 @@
 # by the Apache License, Version 2.0.
 
 import argparse
-import datetime
 import os
+import queue
 import random
 import sys
 import threading
 import time
 from collections import Counter, defaultdict
+from functools import partial
 
 import pg8000
 
@@ -22,16 +23,12 @@ from materialize.mzcompose import DEFAULT_SYSTEM_PARAMETERS
 from materialize.mzcompose.composition import Composition
 from materialize.parallel_workload.action import (
     Action,
+    ActionList,
     BackupRestoreAction,
     CancelAction,
     KillAction,
     StatisticsAction,
     action_lists,
-    ddl_action_list,
-    dml_nontrans_action_list,
-    fetch_action_list,
-    read_action_list,
-    write_action_list,
 )
 from materialize.parallel_workload.database import (
     MAX_CLUSTER_REPLICAS,
@@ -46,13 +43,46 @@ from materialize.parallel_workload.database import (
     MAX_WEBHOOK_SOURCES,
     Database,
 )
-from materialize.parallel_workload.executor import Executor, initialize_logging
+from materialize.parallel_workload.executor import (
+    Executor,
+    ExecutorPool,
+    initialize_logging,
+)
 from materialize.parallel_workload.settings import Complexity, Scenario
 from materialize.parallel_workload.worker import Worker
 from materialize.parallel_workload.worker_exception import WorkerFailedException
 
 SEED_RANGE = 1_000_000
 REPORT_TIME = 10
+SETUP_CONNECTIONS = 4
+
+# TODO: Currently the same as mzcompose default settings, add
+# more settings and shuffle them
+DEFAULT_SYSTEM_PARAMETER_QUERIES = [
+    f"ALTER SYSTEM SET {key} = '{value}'"
+    for key, value in DEFAULT_SYSTEM_PARAMETERS.items()
+]
+
+# Weights for picking each worker's entry of action_lists
+ACTION_LIST_WEIGHTS: dict[Complexity, list[float]] = {
+    Complexity.DDL: [60, 30, 30, 30, 100],
+    Complexity.DML: [60, 30, 30, 30, 0],
+    Complexity.Read: [60, 30, 0, 0, 0],
+}
+
+
+def run_worker(
+    worker: Worker,
+    done_threads: "queue.Queue[str]",
+    host: str,
+    port: int,
+    user: str,
+    database: Database,
+) -> None:
+    try:
+        worker.run(host, port, user, database)
+    finally:
+        done_threads.put(threading.current_thread().name)
 
 
 def run(
@@ -78,99 +108,74 @@ def run(
     )
     initialize_logging()
 
-    end_time = (
-        datetime.datetime.now() + datetime.timedelta(seconds=runtime)
-    ).timestamp()
+    # Monotonic so that clock adjustments don't shorten or extend the run
+    end_time = time.monotonic() + runtime
 
     database = Database(
         rng, seed, host, ports, complexity, scenario, naughty_identifiers, fast_startup
     )
 
-    system_conn = pg8000.connect(
-        host=host, port=ports["mz_system"], user="mz_system", database="materialize"
+    # ALTER SYSTEM and ALTER DEFAULT PRIVILEGES are not allowed inside a
+    # transaction block, and a multi-statement query runs in an implicit one,
+    # so these can't be sent as a single batch. Overlap them on separate
+    # connections instead.
+    system_pool = ExecutorPool(
+        rng, database, host, ports["mz_system"], "mz_system", SETUP_CONNECTIONS
     )
-    system_conn.autocommit = True
-    with system_conn.cursor() as system_cur:
-        system_exe = Executor(rng, system_cur, database)
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_schemas_per_database = {MAX_SCHEMAS * 10 + num_threads}"
-        )
-        # The presence of ALTER TABLE RENAME can cause the total number of tables to exceed MAX_TABLES
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_tables = {MAX_TABLES * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_materialized_views = {MAX_VIEWS * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_sources = {(MAX_WEBHOOK_SOURCES + MAX_KAFKA_SOURCES + MAX_POSTGRES_SOURCES) * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_sinks = {MAX_KAFKA_SINKS * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_roles = {MAX_ROLES * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_clusters = {MAX_CLUSTERS * 10 + num_threads}"
-        )
-        system_exe.execute(
-            f"ALTER SYSTEM SET max_replicas_per_cluster = {MAX_CLUSTER_REPLICAS * 10 + num_threads}"
-        )
-        system_exe.execute("ALTER SYSTEM SET max_secrets = 1000000")
-        # Most queries should not fail because of privileges
-        for object_type in [
-            "TABLES",
-            "TYPES",
-            "SECRETS",
-            "CONNECTIONS",
-            "DATABASES",
-            "SCHEMAS",
-            "CLUSTERS",
-        ]:
-            system_exe.execute(
+    system_pool.run(
+        [
+            partial(Executor.execute, query=query)
+            for query in [
+                f"ALTER SYSTEM SET max_schemas_per_database = {MAX_SCHEMAS * 10 + num_threads}",
+                # The presence of ALTER TABLE RENAME can cause the total number of tables to exceed MAX_TABLES
+                f"ALTER SYSTEM SET max_tables = {MAX_TABLES * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_materialized_views = {MAX_VIEWS * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_sources = {(MAX_WEBHOOK_SOURCES + MAX_KAFKA_SOURCES + MAX_POSTGRES_SOURCES) * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_sinks = {MAX_KAFKA_SINKS * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_roles = {MAX_ROLES * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_clusters = {MAX_CLUSTERS * 10 + num_threads}",
+                f"ALTER SYSTEM SET max_replicas_per_cluster = {MAX_CLUSTER_REPLICAS * 10 + num_threads}",
+                "ALTER SYSTEM SET max_secrets = 1000000",
+            ]
+            # Most queries should not fail because of privileges
+            + [
                 f"ALTER DEFAULT PRIVILEGES FOR ALL ROLES GRANT ALL PRIVILEGES ON {object_type} TO PUBLIC"
-            )
-        system_conn.close()
-        conn = pg8000.connect(
-            host=host,
-            port=ports["materialized"],
-            user="materialize",
-            database="materialize",
-        )
-        conn.autocommit = True
-        with conn.cursor() as cur:
-            assert composition
-            database.create(Executor(rng, cur, database), composition)
-        conn.close()
+                for object_type in [
+                    "TABLES",
+                    "TYPES",
+                    "SECRETS",
+                    "CONNECTIONS",
+                    "DATABASES",
+                    "SCHEMAS",
+                    "CLUSTERS",
+                ]
+            ]
+        ],
+    )
+    system_pool.close()
+
+    pool = ExecutorPool(
+        rng, database, host, ports["materialized"], "materialize", SETUP_CONNECTIONS
+    )
+    assert composition
+    database.create(pool, composition)
+    pool.close()
+
+    if complexity not in ACTION_LIST_WEIGHTS:
+        raise ValueError(f"Unknown complexity {complexity}")
+    weights = ACTION_LIST_WEIGHTS[complexity]
 
     workers = []
     threads = []
+    # Workers only stop before end_time when they fail
+    done_threads: queue.Queue[str] = queue.Queue()
     for i in range(num_threads):
-        weights: list[float]
-        if complexity == Complexity.DDL:
-            weights = [60, 30, 30, 30, 100]
-        elif complexity == Complexity.DML:
-            weights = [60, 30, 30, 30, 0]
-        elif complexity == Complexity.Read:
-            weights = [60, 30, 0, 0, 0]
-        else:
-            raise ValueError(f"Unknown complexity {complexity}")
         worker_rng = random.Random(rng.randrange(SEED_RANGE))
-        action_list = worker_rng.choices(
-            [
-                read_action_list,
-                fetch_action_list,
-                write_action_list,
-                dml_nontrans_action_list,
-                ddl_action_list,
-            ],
-            weights,
-        )[0]
-        actions = [
+        action_list = worker_rng.choices(action_lists, weights)[0]
+        actions = tuple(
             action_class(worker_rng, composition)
             for action_class in action_list.action_classes
-        ]
+        )
         worker = Worker(
             worker_rng,
             actions,
@@ -189,8 +194,15 @@ def run(
 
         thread = threading.Thread(
             name=thread_name,
-            target=worker.run,
-            args=(host, ports["materialized"], "materialize", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["materialized"],
+                "materialize",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
@@ -209,8 +221,15 @@ def run(
         workers.append(worker)
         thread = threading.Thread(
             name="cancel",
-            target=worker.run,
-            args=(host, ports["mz_system"], "mz_system", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["mz_system"],
+                "mz_system",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
@@ -229,8 +248,15 @@ def run(
         workers.append(worker)
         thread = threading.Thread(
             name="kill",
-            target=worker.run,
-            args=(host, ports["materialized"], "materialize", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["materialized"],
+                "materialize",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
@@ -262,8 +288,15 @@ def run(
         workers.append(worker)
         thread = threading.Thread(
             name="toggle-persist-txn",
-            target=worker.run,
-            args=(host, ports["materialized"], "materialize", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["materialized"],
+                "materialize",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
@@ -282,8 +315,15 @@ def run(
         workers.append(worker)
         thread = threading.Thread(
             name="kill",
-            target=worker.run,
-            args=(host, ports["materialized"], "materialize", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["materialized"],
+                "materialize",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
@@ -306,48 +346,60 @@ def run(
         workers.append(worker)
         thread = threading.Thread(
             name="statistics",
-            target=worker.run,
-            args=(host, ports["mz_system"], "mz_system", database),
+            target=run_worker,
+            args=(
+                worker,
+                done_threads,
+                host,
+                ports["mz_system"],
+                "mz_system",
+                database,
+            ),
         )
         thread.start()
         threads.append(thread)
 
-    num_queries = defaultdict(Counter)
+    # Workers only ever increment their own counters, the monitor just reads
+    # them and reports the difference to the previous report
+    last_num_queries = [0] * len(workers)
+    last_report_time = time.monotonic()
     try:
-        while time.time() < end_time:
-            for thread in threads:
-                if not thread.is_alive():
+        while time.monotonic() < end_time:
+            try:
+                thread_name = done_threads.get(timeout=REPORT_TIME)
+            except queue.Empty:
+                pass
+            else:
+                # Stopping at end_time is a regular shutdown, not a failure
+                if time.monotonic() < end_time:
                     query_error = None
                     for worker in workers:
-                        worker.end_time = time.time()
+                        worker.end_time = time.monotonic()
                         query_error = query_error or worker.failed_query_error
                     raise WorkerFailedException(
-                        f"^^^ +++ Thread {thread.name} failed, exiting",
+                        f"^^^ +++ Thread {thread_name} failed, exiting",
                         query_error,
                     )
-            time.sleep(REPORT_TIME)
+            cur_num_queries = [worker.num_queries.total() for worker in workers]
+            # The wait above can end early, so use the actual interval
+            cur_report_time = time.monotonic()
+            interval = cur_report_time - last_report_time
             print(
                 "QPS: "
                 + " ".join(
-                    f"{worker.num_queries.total() / REPORT_TIME:05.1f}"
-                    for worker in workers
+                    f"{(cur - last) / interval:05.1f}"
+                    for cur, last in zip(cur_num_queries, last_num_queries)
                 )
             )
-            for worker in workers:
-                for action in worker.num_queries.elements():
-                    num_queries[worker.action_list][action] += worker.num_queries[
-                        action
-                    ]
-                worker.num_queries.clear()
+            last_num_queries = cur_num_queries
+            last_report_time = cur_report_time
     except KeyboardInterrupt:
         print("Keyboard interrupt, exiting")
         for worker in workers:
-            worker.end_time = time.time()
+            worker.end_time = time.monotonic()
 
-    stopping_time = (
-        datetime.datetime.now() + datetime.timedelta(seconds=300)
-    ).timestamp()
-    while time.time() < stopping_time:
+    stopping_time = time.monotonic() + 300
+    while time.monotonic() < stopping_time:
         for thread in threads:
             thread.join(timeout=1)
         if all([not thread.is_alive() for thread in threads]):
@@ -360,23 +412,30 @@ def run(
         # TODO(def-): Switch to failing exit code when #23582 is fixed
         os._exit(0)
 
-    conn = pg8000.connect(host=host, port=ports["materialized"], user="materialize")
-    conn.autocommit = True
-    with conn.cursor() as cur:
-        exe = Executor(rng, cur, database)
-        for db in database.dbs:
-            print(f"Dropping database {db}")
-            db.drop(exe)
-    conn.close()
+    num_queries: defaultdict[ActionList | None, Counter[type[Action]]] = defaultdict(
+        Counter
+    )
+    for worker in workers:
+        num_queries[worker.action_list].update(worker.num_queries)
+
+    print(f"Dropping databases {', '.join(str(db) for db in database.dbs)}")
+    # Scenarios like Kill restart Materialize, so don't reuse setup connections
+    pool = ExecutorPool(
+        rng,
+        database,
+        host,
+        ports["materialized"],
+        "materialize",
+        min(SETUP_CONNECTIONS, len(database.dbs)),
+    )
+    pool.run([db.drop for db in database.dbs])
+    pool.close()
 
     ignored_errors: defaultdict[str, Counter[type[Action]]] = defaultdict(Counter)
-    num_failures = 0
     for worker in workers:
-        for action_class, counter in worker.ignored_errors.items():
-            ignored_errors[action_class].update(counter)
-    for counter in ignored_errors.values():
-        for count in counter.values():
-            num_failures += count
+        for error, counter in worker.ignored_errors.items():
+            ignored_errors[error].update(counter)
+    num_failures = sum(counter.total() for counter in ignored_errors.values())
 
     total_queries = sum(sub.total() for sub in num_queries.values())
     failed = 100.0 * num_failures / total_queries if total_queries else 0
@@ -462,10 +521,9 @@ def main() -> int:
     )
     system_conn.autocommit = True
     with system_conn.cursor() as cur:
-        # TODO: Currently the same as mzcompose default settings, add
-        # more settings and shuffle them
-        for key, value in DEFAULT_SYSTEM_PARAMETERS.items():
-            cur.execute(f"ALTER SYSTEM SET {key} = '{value}'")
+        # ALTER SYSTEM can't be batched into a multi-statement query, see run()
+        for query in DEFAULT_SYSTEM_PARAMETER_QUERIES:
+            cur.execute(query)
     system_conn.close()
 
     random.seed(args.seed)
@@ -11,6 +11,8 @@ import random
 import threading
 import time
 from collections import Counter, defaultdict
+from collections.abc import Sequence
+from itertools import accumulate
 
 import pg8000
 
@@ -24,8 +26,9 @@ from materialize.parallel_workload.executor import Executor
 class Worker:
     rng: random.Random
     action_list: ActionList | None
-    actions: list[Action]
+    actions: Sequence[Action]
     weights: list[float]
+    cum_weights: list[float]
     end_time: float
     num_queries: Counter[type[Action]]
     autocommit: bool
@@ -38,7 +41,7 @@ class Worker:
     def __init__(
         self,
         rng: random.Random,
-        actions: list[Action],
+        actions: Sequence[Action],
         weights: list[float],
         end_time: float,
         autocommit: bool,
@@ -50,6 +53,9 @@ class Worker:
         self.action_list = action_list
         self.actions = actions
         self.weights = weights
+        # Precomputed so that picking an action per iteration is a bisect
+        # instead of summing up all weights again
+        self.cum_weights = list(accumulate(weights))
         self.end_time = end_time
         self.num_queries = Counter()
         self.autocommit = autocommit
@@ -71,8 +77,8 @@ class Worker:
         cur.execute("SELECT pg_backend_pid()")
         self.exe.pg_pid = cur.fetchall()[0][0]
 
-        while time.time() < self.end_time:
-            action = self.rng.choices(self.actions, self.weights)[0]
+        while time.monotonic() < self.end_time:
+            action = self.rng.choices(self.actions, cum_weights=self.cum_weights)[0]
             try:
                 if self.exe.rollback_next:
                     try:
@@ -110,7 +116,7 @@ class Worker:
                             self.exe.rollback_next = True
                         break
                 else:
-                    thread_name = threading.current_thread().getName()
+                    thread_name = threading.current_thread().name
                     self.failed_query_error = e
                     print(f"+++ [{thread_name}] Query failed: {e.query} {e.msg}")
                     raise